@@ -25,6 +25,26 @@ COMMAND_MAP = {
     i: c
     for (i, c) in enumerate(imppa.all_commands)
 }
+# Reverse of COMMAND_MAP
+# Map from type to ID
+COMMAND_ID = {
+    c: i
+    for (i, c) in COMMAND_MAP.items()
+}
+# Struct sizes don't change, so look them up once
+# instead of asking ctypes on every packet
+CMD_HEAD_SZ = ctypes.sizeof(gg.CommandHeader)
+CMD_SIZE = {
+    c: ctypes.sizeof(c)
+    for c in imppa.all_commands
+}
+TELEMETRY_SIZE = {
+    c: ctypes.sizeof(c)
+    for c in imppa.all_telemetry_packets
+}
+# Receive buffer size for commands;
+# bigger than we will ever need
+COMMAND_BUFSZ = 32768
 # Telemetry we define
 # Map from type to ID
 # ID is determined by ordering in all_telemetry_packets
@@ -32,6 +52,9 @@ TELEMETRY_MAP = {
     c: i
     for (i, c) in enumerate(imppa.all_telemetry_packets)
 }
+# Fallback socket for sends which aren't given one;
+# made on first use by _default_socket
+_shared_socket: socket.socket | None = None
 
 
 def send_telemetry_packet(
@@ -39,19 +62,26 @@ def send_telemetry_packet(
     address: tuple[str, int],
     counter: int,
     given_socket: socket.socket | None=None,
+    head: gg.TelemetryHeader | None=None,
 ):
     '''
     Send a telemetry packet wrapped in the GRIPS format
     from a 'native' IMPISH packet.
+
+    Pass in a `head` to reuse it rather than building
+    a new header for every packet.
     '''
     # Build the header from metadata
-    head = gg.TelemetryHeader()
+    if head is None:
+        head = gg.TelemetryHeader()
+    # Every per-packet field gets set here,
+    # so a reused header carries nothing over
     head.telem_type = TELEMETRY_MAP[type(pkt)]
+    head.size = TELEMETRY_SIZE[type(pkt)]
     head.counter = counter
+    head.gondola_time = int(time.time())
 
-    # Attach the GRIPS header
-    full_packet = bytes(head) + bytes(pkt)
-    send_grips_telem_bytes(full_packet, address, given_socket)
+    send_grips_parts(head, pkt, address, given_socket)
 
 
 def send_grips_telem_bytes(
@@ -65,36 +95,75 @@ def send_grips_telem_bytes(
     th = gg.TelemetryHeader.from_buffer(ba)
     th.gondola_time = int(time.time())
 
-    send_grips_bytes(bytes(ba), address, given_socket)
+    send_grips_bytes(ba, address, given_socket)
 
 
 def send_grips_bytes(
-    pkt: bytes,
+    pkt: bytes | bytearray,
     address: tuple[str, int],
     given_socket: socket.socket | None
 ):
-    # Put in the CRC and verify it worked
-    ba = bytearray(pkt)
+    # Put in the CRC.
+    # A bytearray gets the CRC written in place;
+    # anything else has to be copied to be writable.
+    ba = pkt if isinstance(pkt, bytearray) else bytearray(pkt)
     gg.apply_crc16(ba)
-    gg.verify_crc16(ba)
 
-    # Send data off via a random socket
+    # Send data off via the shared socket
     # or a provided one
-    s = given_socket or socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    s = given_socket or _default_socket()
     s.sendto(ba, address)
 
 
-def receive_command(sock: socket.socket) -> tuple[ctypes.LittleEndianStructure, tuple[str, int]]:
+def send_grips_parts(
+    head: ctypes.LittleEndianStructure,
+    payload: ctypes.LittleEndianStructure,
+    address: tuple[str, int],
+    given_socket: socket.socket | None
+):
+    '''
+    Same as `send_grips_bytes`, but for a GRIPS header and its
+    payload held separately. The CRC is computed across both and
+    the kernel gathers them into one datagram, so the header and
+    payload never get concatenated in Python.
+    '''
+    gg.apply_crc16_split(head, payload)
+
+    s = given_socket or _default_socket()
+    s.sendmsg([head, payload], [], 0, address)
+
+
+def _default_socket() -> socket.socket:
+    '''
+    Socket to send from when the caller doesn't give one.
+    Made once and shared, rather than opening (and leaking)
+    a new socket for every packet.
+    '''
+    global _shared_socket
+    if _shared_socket is None:
+        _shared_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    return _shared_socket
+
+
+def receive_command(
+    sock: socket.socket,
+    buf: bytearray | None=None
+) -> dict:
     '''
     Receive a GRIPS packet assuming its command header structure.
+
+    If `buf` is given, the packet is received into it
+    instead of into a newly allocated buffer.
     '''
-    # bigger buffer than we will ever need
-    BUFSZ = 32768
-    data, addr = sock.recvfrom(BUFSZ)
-    return decode_command(data, addr)
+    if buf is None:
+        data, addr = sock.recvfrom(COMMAND_BUFSZ)
+        return decode_command(data, addr)
+
+    nbytes, addr = sock.recvfrom_into(buf)
+    return decode_command(memoryview(buf)[:nbytes], addr)
 
 
-def decode_command(data: bytes, addr: tuple[str, int]) -> dict:
+def decode_command(data: bytes | bytearray | memoryview, addr: tuple[str, int]) -> dict:
     '''
     Goes through all of the  steps to verify that
     the packet is good as per the error codes defined
@@ -108,11 +177,11 @@ def decode_command(data: bytes, addr: tuple[str, int]) -> dict:
         - packet header
         - decoded packet contents
         - sender address
-    '''
-    data = bytearray(data)
 
-    head_sz = ctypes.sizeof(gg.CommandHeader)
-    if len(data) < head_sz:
+    The header and contents are copied out of `data`,
+    so any buffer works and it may be reused afterwards.
+    '''
+    if len(data) < CMD_HEAD_SZ:
         raise gg.AcknowledgeError(
             gg.CommandAcknowledgement.PARTIAL_HEADER,
             data,
@@ -121,7 +190,7 @@ def decode_command(data: bytes, addr: tuple[str, int]) -> dict:
             imppa.UnknownCmd
         )
 
-    decoded = gg.CommandHeader.from_buffer(data)
+    decoded = gg.CommandHeader.from_buffer_copy(data)
 
     if decoded.base_header.sync != gg.GRIPS_SYNC:
         raise gg.AcknowledgeError(
@@ -165,7 +234,8 @@ def decode_command(data: bytes, addr: tuple[str, int]) -> dict:
     # we can pick the correct command type confidently
     cmd_type = COMMAND_MAP[decoded.cmd_type]
 
-    actual_packet_length = ctypes.c_uint8(len(data) - head_sz).value
+    # The size field is a u8, so compare modulo 256
+    actual_packet_length = (len(data) - CMD_HEAD_SZ) & 0xFF
     reported_length = decoded.size
     if actual_packet_length != reported_length:
         raise gg.AcknowledgeError(
@@ -176,7 +246,7 @@ def decode_command(data: bytes, addr: tuple[str, int]) -> dict:
             cmd_type
         )
 
-    if decoded.size != ctypes.sizeof(cmd_type):
+    if decoded.size != CMD_SIZE[cmd_type]:
         raise gg.AcknowledgeError(
             gg.CommandAcknowledgement.INVALID_PACKET_LENGTH,
             bytes(decoded.size),
@@ -189,22 +259,31 @@ def decode_command(data: bytes, addr: tuple[str, int]) -> dict:
     # errors must be handled separately.
     return {
         'header': decoded,
-        'contents': cmd_type.from_buffer(data, head_sz),
+        'contents': cmd_type.from_buffer_copy(data, CMD_HEAD_SZ),
         'sender': addr
     }
 
 
-def grips_cmd_header_from_packet(pkt: ctypes.LittleEndianStructure, seq_num: int):
+def grips_cmd_header_from_packet(
+    pkt: ctypes.LittleEndianStructure,
+    seq_num: int,
+    head: gg.CommandHeader | None=None
+):
     '''
     Construct a command header given a "known" packet type.
     Just a wrapper around the constructor, but incorporates
     the information within `impish.network.packets.all_commands` to
     assign the cmd_type.
+    Raises KeyError if the packet type is not a known command.
+
+    If `head` is given, its fields are overwritten and it is
+    returned instead of a new header.
     '''
-    head = gg.CommandHeader()
-    head.cmd_type = imppa.all_commands.index(type(pkt))
+    if head is None:
+        head = gg.CommandHeader()
+    head.cmd_type = COMMAND_ID[type(pkt)]
     head.counter = seq_num
-    head.size = ctypes.sizeof(pkt)
+    head.size = CMD_SIZE[type(pkt)]
     return head
 
 
@@ -236,6 +315,9 @@ class Commander:
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.bind(('0.0.0.0', port))
 
+        # Scratch header which gets refilled for each command
+        self._cmd_head = gg.CommandHeader()
+
     def send_command(
         self,
         pkt: ctypes.LittleEndianStructure,
@@ -247,19 +329,17 @@ class Commander:
            Returns the cmd response.
         '''
         try:
-            head = grips_cmd_header_from_packet(pkt, self.sequence_number)
+            head = grips_cmd_header_from_packet(
+                pkt, self.sequence_number, self._cmd_head)
         except KeyError:
             raise ValueError(f'{type(pkt)} is an unrecognized command')
 
         # Might throw; wait to increment seq_num until after call
-        send_grips_bytes(
-            bytes(head) + bytes(pkt),
-            address, self.socket
-        )
+        send_grips_parts(head, pkt, address, self.socket)
         # Sequence number can only be in [0, 255] 
         # because it's a u8
         self.sequence_number += 1
-        self.sequence_number %= 256
+        self.sequence_number &= 0xFF
 
     def recv_ack(self) -> gg.CommandAcknowledgement:
         # The command acknoqledgement should arrive synchronously
@@ -291,6 +371,10 @@ class CommandRouter:
             socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.bind(('0.0.0.0', listen_port))
 
+        # Every command gets received into this buffer;
+        # decoding copies out what it needs
+        self._recv_buf = bytearray(COMMAND_BUFSZ)
+
         # Keep track of the command sequence number as part
         # of the object state
         self.expected_cmd_seq_num = None
@@ -311,7 +395,7 @@ class CommandRouter:
         # Parse a received command into structured data
         ci = CommandInfo()
         try:
-            recvd_cmd = receive_command(self.socket)
+            recvd_cmd = receive_command(self.socket, self._recv_buf)
             ci.payload = recvd_cmd['contents']
             ci.sender = recvd_cmd['sender']
             ci.seq_num = recvd_cmd['header'].counter
@@ -366,7 +450,7 @@ class CommandRouter:
 
         # Increment the number in expectation of the next command
         self.expected_cmd_seq_num += 1
-        self.expected_cmd_seq_num %= 256
+        self.expected_cmd_seq_num &= 0xFF
 
     def _handle_error(self, e: gg.AcknowledgeError) -> None:
         '''If we get an error from some portion of the
@@ -411,6 +495,9 @@ class Telemeter:
         # you have to update things after object initialization.
         self.port_map: dict[int, type[ctypes.LittleEndianStructure]] = dict()
 
+        # Scratch header which gets refilled for each packet
+        self._telem_head = gg.TelemetryHeader()
+
     def telemeter(self) -> None:
         '''
         Wait on the object's UDP socket until some data comes in;
@@ -430,8 +517,9 @@ class Telemeter:
             type_.from_buffer_copy(data),
             self.destination,
             self.sequence_number,
-            self.socket
+            self.socket,
+            self._telem_head
         )
 
         self.sequence_number += 1
-        self.sequence_number %= int(2**16)
+        self.sequence_number &= 0xFFFF
@@ -69,6 +69,7 @@ def test_cmd_telemetry_loop():
     recvd = data_sock.recv(1024)
     head = gg.TelemetryHeader.from_buffer_copy(recvd)
     data = packets.Dummy.from_buffer_copy(recvd, ctypes.sizeof(head))
+    assert head.size == ctypes.sizeof(data)
 
     # Verify that the data is the same as we sent.
     assert(all([
@@ -201,3 +202,59 @@ def test_exceptional_commander():
         cmd_dat = receiver.recv(2048)
         head = gg.CommandHeader.from_buffer_copy(cmd_dat)
         assert head.counter == (i % 256)
+
+
+def test_crc16():
+    '''Check the table-driven CRC16 against the plain bitwise
+       Modbus algorithm, for odd and even packet lengths.'''
+    def bitwise_crc16(msg):
+        crc = 0xFFFF
+        for b in msg:
+            crc ^= b
+            for _ in range(8):
+                if crc & 1:
+                    crc = (crc >> 1) ^ 0xA001
+                else:
+                    crc >>= 1
+        return crc
+
+    # Standard CRC-16/MODBUS check value
+    assert gg.compute_modbus_crc16(b'123456789') == 0x4B37
+
+    for size in range(64):
+        msg = bytes((7 * i + size) % 256 for i in range(size))
+        assert gg.compute_modbus_crc16(msg) == bitwise_crc16(msg)
+        assert gg.compute_modbus_crc16(bytearray(msg)) == bitwise_crc16(msg)
+
+
+def test_crc16_roundtrip():
+    '''A freshly applied CRC must verify, both for a whole
+       packet and for a header and payload kept apart.
+       Any corruption afterwards must not.'''
+    pkt = packets.Dummy()
+    pkt.data[:] = [(3 * i) % 256 for i in range(len(pkt.data))]
+
+    whole = bytearray(bytes(gg.TelemetryHeader()) + bytes(pkt))
+    gg.apply_crc16(whole)
+    gg.verify_crc16(whole)
+
+    head = gg.TelemetryHeader()
+    gg.apply_crc16_split(head, pkt)
+    assert bytes(head) + bytes(pkt) == bytes(whole)
+
+    whole[-1] ^= 0xFF
+    with pytest.raises(gg.CrcError):
+        gg.verify_crc16(whole)
+
+
+def test_crc16_verify_readonly():
+    '''Verifying a CRC works on read-only buffers
+       and leaves the packet untouched.'''
+    pkt = bytearray(bytes(gg.CommandHeader()) + bytes(range(40)))
+    gg.apply_crc16(pkt)
+    before = bytes(pkt)
+
+    gg.verify_crc16(before)
+    gg.verify_crc16(memoryview(before))
+    gg.verify_crc16(pkt)
+    assert bytes(pkt) == before
@@ -97,7 +97,7 @@ def arb_command_handler(
     ack = gg.CommandAcknowledgement()
     ack.pre_send(
         ci.seq_num,
-        packets.all_commands.index(type(ci.payload))
+        comm.COMMAND_ID[type(ci.payload)]
     )
     return ack
 